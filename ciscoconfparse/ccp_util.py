@@ -23,8 +23,10 @@ r""" ccp_util.py - Parse, Query, Build, and Modify IOS-style configurations
 """
 
 from operator import attrgetter
-from functools import wraps
+from functools import wraps, lru_cache, total_ordering
+from itertools import chain
 import socket
+import copy
 import time
 import sys
 import re
@@ -34,12 +36,9 @@ from collections.abc import MutableSequence, Sequence
 from ipaddress import IPv4Network, IPv6Network, IPv4Address, IPv6Address
 from ipaddress import collapse_addresses as ipaddr_collapse_addresses
 from ipaddress import AddressValueError
+from ipaddress import ip_address
 
 
-from dns.exception import DNSException
-from dns.resolver import Resolver
-from dns import reversename, query, zone
-
 from deprecat import deprecat
 
 from loguru import logger
@@ -49,6 +48,9 @@ from ciscoconfparse.errors import PythonOptimizeException
 import ciscoconfparse
 
 
+# Upper bound on the number of cached IPv4Obj.get() / IPv6Obj.get() results
+_IPOBJ_CACHE_MAXSIZE = 131072
+
 # Maximum ipv4 as an integer
 IPV4_MAXINT = 4294967295
 # Maximum ipv6 as an integer
@@ -60,12 +62,17 @@ IPV4_MAX_PREFIXLEN = 32
 IPV6_MAX_PREFIXLEN = 128
 
 
-_CISCO_RANGE_ATOM_STR = r"""\d+\s*\-*\s*\d*"""
-_CISCO_RANGE_STR = r"""^(?P<line_prefix>[a-zA-Z\s]*)(?P<slot_prefix>[\d\/]*\d+\/)*(?P<range_text>(\s*{})*)$""".format(
-    _CISCO_RANGE_ATOM_STR
-)
+# range_text matches the same strings as the old r"(\s*\d+\s*\-*\s*\d*)*",
+#     but without nested quantifiers that can split a run of digits many
+#     different ways (which made failed matches backtrack exponentially).
+#     '-(?!\s*-)' ensures that two runs of dashes are separated by a number.
+_CISCO_RANGE_STR = r"""^(?P<line_prefix>[a-zA-Z\s]*)(?P<slot_prefix>(?:[\d\/]*\d+\/)?)(?P<range_text>(?:\s*\d[\d\s]*(?:\-+(?!\s*\-)[\d\s]*)*)?)$"""
 _RGX_CISCO_RANGE = re.compile(_CISCO_RANGE_STR)
 
+# Used by L4Object() to parse port_spec
+_RGX_WHITESPACE = re.compile(r"\s+")
+_RGX_SINGLE_WORD = re.compile(r"^\S+$")
+
 ####################### Begin IPv6 #############################
 _IPV6_REGEX_STR = r"""(?!:::\S+?$)       # Negative Lookahead for 3 colons
  (?P<addr>                               # Begin a group named 'addr'
@@ -97,23 +104,14 @@ _IPV6_REGEX_STR_COMPRESSED3 = r"""(?!:::\S+?$)(?P<addr3>(?P<opt3_1>{0}(?::{0}){{
 )
 
 _RGX_IPV6ADDR = re.compile(_IPV6_REGEX_STR, re.VERBOSE)
+
+# Characters which may appear in an IPv6 address (before any %scope_id)
+_IPV6_ADDR_CHARS = frozenset("0123456789abcdefABCDEF:.")
 ####################### End IPv6 #############################
 
 ####################### Begin IPv4 #############################
 _IPV4_REGEX_STR = r"^(?P<addr>\d+\.\d+\.\d+\.\d+)"
 _RGX_IPV4ADDR = re.compile(_IPV4_REGEX_STR)
-_RGX_IPV4ADDR_NETMASK = re.compile(
-    r"""
-     (?:
-       ^(?P<addr0>\d+\.\d+\.\d+\.\d+)$
-      |(?:^
-         (?:(?P<addr1>\d+\.\d+\.\d+\.\d+))(?:\s+|\/)(?:(?P<netmask>\d+\.\d+\.\d+\.\d+))
-       $)
-      |^(?:\s*(?P<addr2>\d+\.\d+\.\d+\.\d+)(?:\/(?P<masklen>\d+))\s*)$
-    )
-    """,
-    re.VERBOSE,
-)
 ####################### End IPv4 #############################
 
 
@@ -452,7 +450,7 @@ def fix_repeated_words(cmd="", word=""):
             # We found a repeated word in the command...
             indent = mm.group('indent')
             remaining_cmd = mm.group('remaining_cmd')
-            cmd = "{0}{1}".format(indent, remaining_cmd)
+            cmd = f"{indent}{remaining_cmd}"
         else:
             break
     return cmd
@@ -632,10 +630,11 @@ def _get_ipv4(val="", strict=False, stdlib=False, debug=0):
         # if there's a problem...
         IPv4Network(val, strict=False)
 
-        obj = IPv4Obj(val)
         if stdlib is False:
-            return obj
+            return IPv4Obj(val)
         else:
+            # stdlib objects are immutable, so a cached IPv4Obj() is safe here
+            obj = IPv4Obj.get(val)
             if obj.prefixlen == IPV4_MAX_PREFIXLEN:
                 # Return IPv6Address()
                 if not isinstance(obj.ip, IPv4Address):
@@ -673,10 +672,11 @@ def _get_ipv6(val="", strict=False, stdlib=False, debug=0):
         # if there's a problem...
         IPv6Network(val, strict=False)
 
-        obj = IPv6Obj(val)
         if stdlib is False:
-            return obj
+            return IPv6Obj(val)
         else:
+            # stdlib objects are immutable, so a cached IPv6Obj() is safe here
+            obj = IPv6Obj.get(val)
             if obj.prefixlen == IPV6_MAX_PREFIXLEN:
                 # Return IPv6Address()
                 if not isinstance(obj.ip, IPv6Address):
@@ -789,9 +789,19 @@ def collapse_addresses(network_list):
 
 # Build a wrapper around ipaddress classes to mimic the behavior of network
 # interfaces (such as persisting host-bits when the intf masklen changes) and
-# add custom @properties
+# add custom @properties; total_ordering derives the other rich comparisons
+# from __eq__() and __lt__()
+@total_ordering
 class IPv4Obj(object):
 
+    # These objects are built in bulk (one per address in a config), so
+    # skip the per-instance __dict__
+    __slots__ = (
+        "arg", "dna", "ip_object", "network_object", "strict", "debug",
+        "_as_decimal", "_as_decimal_network", "_prefixlen", "_numhosts",
+        "_net_hi", "_frozen",
+    )
+
     # This method is on IPv4Obj().  Do NOT add @logger.catch to __init__()...
     # that breaks it.
     def __init__(self, arg=f"127.0.0.1/{IPV4_MAX_PREFIXLEN}", strict=False, debug=0):
@@ -919,60 +929,45 @@ class IPv4Obj(object):
         self.network_object = None
         self.strict = strict
         self.debug = debug
-        self.params_dict = {}
+        self._frozen = False
 
-        # Build params_dict... this needs to work with any supported input...
-        if isinstance(arg, str):
-            params_dict = self._ipv4_params_dict(arg)
-            self.params_dict = params_dict
-
-        elif isinstance(arg, int):
-            params_dict = self._ipv4_params_dict(arg)
-            self.params_dict = params_dict
-
-        elif isinstance(arg, IPv4Obj):
-            params_dict = {
-                'ipv4_addr': str(arg.ip),
-                'ip_version': 4,
-                'ip_arg_str': str(arg.ip) + "/" + str(arg.masklen),
-                'netmask': str(arg.netmask),
-                'masklen': str(arg.masklen),
-            }
-            self.params_dict = params_dict
-
-        else:
+        if not isinstance(arg, (str, int, IPv4Obj)):
             raise ValueError("type(%s) is not supported" % arg)
 
-
         if isinstance(arg, str):
             # Removing string length checks in 1.6.29... there are too many
             #    options such as IPv4Obj("111.111.111.111      255.255.255.255")
-            # RECURSION
-            self.network_object = IPv4Network(params_dict['ip_arg_str'], strict=strict)
-            self.ip_object = IPv4Address(params_dict['ipv4_addr'])
-            return None
+            addr, mask = self._split_addr_mask(arg)
+            # The (int, mask) tuple form accepts a prefixlen or a dotted
+            # netmask; passing the IPv4Address() itself would make ipaddress
+            # format and re-parse the address string
+            self.ip_object = IPv4Address(addr)
+            self.network_object = IPv4Network((int(self.ip_object), mask), strict=strict)
 
         elif isinstance(arg, int):
             assert 0 <= arg <= IPV4_MAXINT
             self.network_object = IPv4Network(arg, strict=strict)
             self.ip_object = IPv4Address(arg)
-            return None
 
         elif isinstance(arg, IPv4Obj):
-            ip_str = f"{str(arg.ip_object)}/{arg.prefixlen}"
-            self.network_object = IPv4Network(ip_str, strict=False)
-            self.ip_object = IPv4Address(str(arg.ip_object))
+            # ipaddress objects are immutable, so share them (and the cached
+            # integers) with arg instead of re-parsing arg as a string
+            self.network_object = arg.network_object
+            self.ip_object = arg.ip_object
+            self._as_decimal = arg._as_decimal
+            self._as_decimal_network = arg._as_decimal_network
+            self._prefixlen = arg._prefixlen
+            self._numhosts = arg._numhosts
+            self._net_hi = arg._net_hi
             return None
 
         elif isinstance(arg, IPv4Network):
             self.network_object = arg
-            self.ip_object = IPv4Address(str(arg).split("/")[0])
-            return None
+            self.ip_object = arg.network_address
 
         elif isinstance(arg, IPv4Address):
-            self.network_object = IPv4Network(str(arg) + "/" + str(IPV4_MAX_PREFIXLEN))
-            self.ip_object = IPv4Address(str(arg).split("/")[0])
-            return None
+            self.network_object = IPv4Network((int(arg), IPV4_MAX_PREFIXLEN))
+            self.ip_object = arg
 
         else:
             raise AddressValueError(
@@ -981,196 +976,152 @@ class IPv4Obj(object):
                 )
             )
 
+        self._update_cached_attrs()
+
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
-    def _ipv4_params_dict(self, arg, debug=0):
+    @classmethod
+    def _from_int_prefix(cls, ip_int, prefixlen):
         """
-        Parse out important IPv4 parameters from arg.  This method must run to
-        completion for IPv4 address parsing to work correctly.
+        Build an IPv4Obj() straight from an integer address and a prefixlen,
+        without parsing (or formatting) any strings.
         """
-        if not (isinstance(arg, str) or isinstance(arg, int) or isinstance(arg, IPv4Obj)):
-            raise ValueError
+        obj = cls.__new__(cls)
+        obj.arg = ip_int
+        obj.dna = "IPv4Obj"
+        obj.strict = False
+        obj.debug = 0
+        obj._frozen = False
+        obj.ip_object = IPv4Address(ip_int)
+        obj.network_object = IPv4Network((ip_int, prefixlen), strict=False)
+        obj._update_cached_attrs()
+        return obj
 
-        if isinstance(arg, str):
-            try:
-                mm = _RGX_IPV4ADDR_NETMASK.search(arg)
-            except TypeError:
-                raise AddressValueError(
-                    f"_ipv4_params_dict() doesn't understand how to parse {arg}"
-                )
-
-            error_msg = f"_ipv4_params_dict() couldn't parse '{arg}'"
-            assert mm is not None, error_msg
-
-            mm_result = mm.groupdict()
-            addr = (
-                mm_result["addr0"] or mm_result["addr1"]
-                or mm_result["addr2"] or "127.0.0.1"
-            )
-            ## Normalize if we get zero-padded strings, i.e. 172.001.001.001
-            assert re.search(r"^\d+\.\d+.\d+\.\d+", addr)
-            addr = ".".join([str(int(ii)) for ii in addr.split(".")])
-
-            netmask = mm_result["netmask"]
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @classmethod
+    def get(cls, arg, strict=False):
+        """
+        Return a cached IPv4Obj() for ``arg``.  This is much faster than
+        IPv4Obj(arg) when the same strings are parsed over and over again.
 
-            masklen = int(mm_result.get("masklen", None) or IPV4_MAX_PREFIXLEN)
+        The returned object is shared by all callers, so it is read-only;
+        changing its prefixlen raises AttributeError.  Copy it with
+        ``IPv4Obj(obj)`` first.
+        """
+        if isinstance(arg, str) and cls is IPv4Obj:
+            return _ipv4_from_str(arg, strict)
+        return cls(arg, strict=strict)
 
-            if netmask is not None:
-                ip_arg_str = f"{addr}/{netmask}"
-            elif masklen is not None:
-                ip_arg_str = f"{addr}/{masklen}"
-            else:
-                raise AddressValueError()
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    def _update_cached_attrs(self):
+        """
+        Cache the integers used by comparisons, hashing and containment
+        checks.  This must be called whenever ip_object or network_object
+        changes.
+        """
+        self._as_decimal = int(self.ip_object)
+        self._as_decimal_network = int(self.network_object.network_address)
+        self._prefixlen = self.network_object.prefixlen
+        self._numhosts = 1 << (IPV4_MAX_PREFIXLEN - self._prefixlen)
+        # The last address in network_object, as an integer
+        self._net_hi = self._as_decimal_network + self._numhosts - 1
 
-        elif isinstance(arg, int):
-            addr = str(IPv4Address(arg))
-            netmask = "255.255.255.255"
-            masklen = 32
-            ip_arg_str = f"{addr}/{masklen}"
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @staticmethod
+    def _split_addr_mask(arg):
+        """
+        Split an IPv4 address string into an (addr, netmask_or_masklen)
+        tuple.  Supported formats: "10.1.1.1", "10.1.1.1/24",
+        "10.1.1.1/255.255.255.0" and "10.1.1.1 255.255.255.0"
+        """
+        ERROR = f"IPv4Obj() couldn't parse '{arg}'"
+
+        parts = arg.split()
+        if len(parts) == 1:
+            addr, sep, mask = parts[0].partition("/")
+            if sep == "":
+                mask = IPV4_MAX_PREFIXLEN
+            elif mask == "":
+                # Truncated input such as "10.1.1.1/"
+                raise AddressValueError(ERROR)
+        elif len(parts) == 2 and "/" not in arg and "." in parts[1]:
+            # Only a dotted netmask may follow whitespace
+            addr, mask = parts
+        else:
+            raise AddressValueError(ERROR)
 
-        elif isinstance(arg, IPv4Obj):
-            addr = str(arg.ip)
-            netmask = str(arg.netmask)
-            masklen = arg.masklen
-            ip_arg_str = f"{addr}/{masklen}"
+        ## Normalize if we get zero-padded strings, i.e. 172.001.001.001
+        if "0" in addr:
+            octets = addr.split(".")
+            if all(ii.isdigit() for ii in octets):
+                addr = ".".join([str(int(ii)) for ii in octets])
 
-        else:
-            raise AddressValueError("IPv4Obj(arg='%s') is an unknown argument type" % (arg))
+        return addr, mask
 
-        assert 0 <= masklen <= IPV4_MAX_PREFIXLEN
-        params_dict = {
-            'ipv4_addr': addr,
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @property
+    def params_dict(self):
+        """Return a dict of the parsed IPv4 parameters of this object"""
+        return {
+            'ipv4_addr': str(self.ip_object),
             'ip_version': 4,
-            'ip_arg_str': ip_arg_str,
-            'netmask': netmask,
-            'masklen': masklen,
+            'ip_arg_str': f"{self.ip_object}/{self._prefixlen}",
+            'netmask': str(self.network_object.netmask),
+            'masklen': self._prefixlen,
         }
 
-        return params_dict
-
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     def __repr__(self):
         if not isinstance(self.prefixlen, int):
             raise ValueError
 
-        return f"""<IPv4Obj {str(self.ip_object)}/{self.prefixlen}>"""
+        return f"""<IPv4Obj {self.ip_object}/{self._prefixlen}>"""
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     def __eq__(self, val):
-        try:
-            # Code to fix Github issue #180
-            for obj in [self, val]:
-                for attr_name in ["as_decimal", "prefixlen"]:
-                    try:
-                        assert getattr(obj, attr_name, None) is not None
-                    except AssertionError:
-                        return False
-
-            # Compare objects numerically...
-            if self.as_decimal == val.as_decimal and self.prefixlen == val.prefixlen:
-                return True
-            return False
-        except AttributeError as e:
-            errmsg = "'{}' cannot compare itself to '{}': {}".format(
-                self.__repr__(), val, e
-            )
-            raise AttributeError(errmsg)
+        if val is self:
+            return True
 
-    # do NOT wrap with @logger.catch(...)
-    # On IPv4Obj()
-    def __ne__(self, val):
-        return not self.__eq__(val)
+        # Let python fall back to False for other types, i.e. Github issue #180;
+        # python also derives __ne__() from this method
+        if not isinstance(val, IPv4Obj):
+            return NotImplemented
 
-    # do NOT wrap with @logger.catch(...)
-    # On IPv4Obj()
-    def __gt__(self, val):
-        try:
-            for obj in [self, val]:
-                for attr_name in ["as_decimal", "as_decimal_network", "prefixlen"]:
-                    try:
-                        assert getattr(obj, attr_name, None) is not None
-                    except (AssertionError):
-                        error_str = "Cannot compare {} with '{}'".format(
-                            self, type(obj)
-                        )
-                        raise AssertionError(error_str)
-
-            val_prefixlen = int(getattr(val, "prefixlen"))
-            self_prefixlen = int(getattr(self, "prefixlen"))
-            val_ndec = int(getattr(val, "as_decimal_network"))
-            self_ndec = int(getattr(self, "as_decimal_network"))
-            val_dec = int(getattr(val, "as_decimal"))
-            self_dec = int(getattr(self, "as_decimal"))
-
-            if self_ndec == val_ndec and self_prefixlen == val_prefixlen:
-                return self_dec > val_dec
-
-            # for the same network, longer prefixlens sort "higher" than shorter prefixlens
-            elif self_ndec == val_ndec:
-                return self_prefixlen > val_prefixlen
-
-            else:
-                return self_ndec > val_ndec
-
-        except Exception:
-            errmsg = f"{self.__repr__()} cannot compare itself to '{val}'"
-            raise ValueError(errmsg)
+        return self._as_decimal == val._as_decimal and self._prefixlen == val._prefixlen
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     def __lt__(self, val):
-        try:
-            for obj in [self, val]:
-                for attr_name in ["as_decimal", "as_decimal_network", "prefixlen"]:
-                    try:
-                        assert getattr(obj, attr_name, None) is not None
-                    except (AssertionError):
-                        error_str = "Cannot compare {} with '{}'".format(
-                            self, type(obj)
-                        )
-                        raise AssertionError(error_str)
-
-            val_prefixlen = int(getattr(val, "prefixlen"))
-            self_prefixlen = int(getattr(self, "prefixlen"))
-            val_ndec = int(getattr(val, "as_decimal_network"))
-            self_ndec = int(getattr(self, "as_decimal_network"))
-            val_dec = int(getattr(val, "as_decimal"))
-            self_dec = int(getattr(self, "as_decimal"))
-
-            if self_ndec == val_ndec and self_prefixlen == val_prefixlen:
-                return self_dec < val_dec
-
-            # for the same network, longer prefixlens sort "higher" than shorter prefixlens
-            elif self_ndec == val_ndec:
-                return self_prefixlen < val_prefixlen
-
-            else:
-                return self_ndec < val_ndec
+        if isinstance(val, IPv4Obj):
+            val_key = (val._as_decimal_network, val._prefixlen, val._as_decimal)
+        else:
+            try:
+                val_key = (val.as_decimal_network, val.prefixlen, val.as_decimal)
+            except AttributeError:
+                errmsg = f"{self.__repr__()} cannot compare itself to '{val}'"
+                logger.error(errmsg)
+                raise ValueError(errmsg)
 
-        except Exception:
-            errmsg = f"{self.__repr__()} cannot compare itself to '{val}'"
-            logger.error(errmsg)
-            raise ValueError(errmsg)
+        # for the same network, longer prefixlens sort "higher" than shorter prefixlens
+        return (self._as_decimal_network, self._prefixlen, self._as_decimal) < val_key
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     def __int__(self):
         """Return this object as an integer"""
-        if getattr(self, "as_decimal", None) is not None:
-            return self.as_decimal
-        else:
-            return False
+        return self._as_decimal
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     def __index__(self):
         """Return this object as an integer (used for hex() and bin() operations)"""
-        if getattr(self, "as_decimal", None) is not None:
-            return self.as_decimal
-        else:
-            return False
+        return self._as_decimal
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1179,13 +1130,11 @@ class IPv4Obj(object):
         if not isinstance(val, int):
             raise ValueError("Cannot add type: '{0}' to IPv4Obj()".format(type(val)))
 
-        orig_prefixlen = self.prefixlen
-        total = self.as_decimal + val
+        orig_prefixlen = self._prefixlen
+        total = self._as_decimal + val
         assert total <= IPV4_MAXINT, "Max IPv4 integer exceeded"
         assert total >= 0, "Min IPv4 integer exceeded"
-        retval = IPv4Obj(total)
-        retval.prefixlen = orig_prefixlen
-        return retval
+        return IPv4Obj._from_int_prefix(total, orig_prefixlen)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1194,22 +1143,30 @@ class IPv4Obj(object):
         if not isinstance(val, int):
             raise ValueError("Cannot subtract type: '{}' from {}".format(type(val), self))
 
-        orig_prefixlen = self.prefixlen
-        total = self.as_decimal - val
+        orig_prefixlen = self._prefixlen
+        total = self._as_decimal - val
         assert total < IPV4_MAXINT, "Max IPv4 integer exceeded"
         assert total >= 0, "Min IPv4 integer exceeded"
-        retval = IPv4Obj(total)
-        retval.prefixlen = orig_prefixlen
-        return retval
+        return IPv4Obj._from_int_prefix(total, orig_prefixlen)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     def __contains__(self, val):
         # Used for "foo in bar"... python calls bar.__contains__(foo)
         try:
-            if self.network_object.prefixlen == 0:
+            if self._prefixlen == 0:
                 return True
-            elif self.network_object.prefixlen > val.network_object.prefixlen:
+
+            if isinstance(val, IPv4Obj):
+                val_prefixlen = val._prefixlen
+                val_lo, val_hi = val._as_decimal_network, val._net_hi
+            else:
+                val_network = val.network_object
+                val_prefixlen = val_network.prefixlen
+                val_lo = int(val_network.network_address)
+                val_hi = int(val_network.broadcast_address)
+
+            if self._prefixlen > val_prefixlen:
                 # obvious shortcut... if this object's mask is longer than
                 #    val, this object cannot contain val
                 return False
@@ -1220,10 +1177,7 @@ class IPv4Obj(object):
                 # return (self.network <= val.network) and (
                 #    self.broadcast >= val.broadcast
                 # )
-                return (self.as_decimal_network <= val.as_decimal_network) and (
-                    (self.as_decimal_network + self.numhosts - 1)
-                    >= (val.as_decimal_network + val.numhosts - 1)
-                )
+                return self._as_decimal_network <= val_lo and val_hi <= self._net_hi
 
         except ValueError as e:
             raise ValueError(
@@ -1236,7 +1190,7 @@ class IPv4Obj(object):
     # On IPv4Obj()
     def __hash__(self):
         # Python3 needs __hash__()
-        return hash(str(self.ip_object)) + hash(str(self.prefixlen))
+        return hash((self._as_decimal, self._prefixlen))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1249,12 +1203,6 @@ class IPv4Obj(object):
         ## For Python3 iteration...
         return self.network_object.__next__()
 
-    # do NOT wrap with @logger.catch(...)
-    # On IPv4Obj()
-    def next(self):
-        ## For Python2 iteration...
-        return self.network_object.__next__()
-
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
@@ -1264,15 +1212,6 @@ class IPv4Obj(object):
         """
         return self.version
 
-    # do NOT wrap with @logger.catch(...)
-    # On IPv4Obj()
-    @property
-    def _prefixlen(self):
-        """
-        Fix github issue #203... build a `_prefixlen` attribute...
-        """
-        return self.prefixlen
-
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
@@ -1293,7 +1232,7 @@ class IPv4Obj(object):
     @property
     def _ip(self):
         """Returns the address as an integer.  This property exists for compatibility with ipaddress.IPv4Address() in stdlib"""
-        return int(self.ip_object)
+        return self._as_decimal
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1314,64 +1253,62 @@ class IPv4Obj(object):
     @property
     def masklen(self):
         """Returns the length of the network mask as an integer."""
-        return int(self.network_object.prefixlen)
+        return self._prefixlen
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @masklen.setter
     def masklen(self, arg):
         """masklen setter method"""
-        self.network_object = IPv4Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self.prefixlen = arg
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def masklength(self):
         """Returns the length of the network mask as an integer."""
-        return self.prefixlen
+        return self._prefixlen
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @masklength.setter
     def masklength(self, arg):
         """masklen setter method"""
-        self.network_object = IPv4Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self.prefixlen = arg
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def prefixlen(self):
         """Returns the length of the network mask as an integer."""
-        return int(self.network_object.prefixlen)
+        return self._prefixlen
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @prefixlen.setter
     def prefixlen(self, arg):
         """prefixlen setter method"""
-        self.network_object = IPv4Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        if self._frozen:
+            raise AttributeError(
+                f"{self!r} is shared by IPv4Obj.get(); copy it with "
+                "IPv4Obj(obj) before changing it"
+            )
+        self.network_object = IPv4Network((self._as_decimal, arg), strict=False)
+        self._update_cached_attrs()
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def prefixlength(self):
         """Returns the length of the network mask as an integer."""
-        return self.prefixlen
+        return self._prefixlen
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @prefixlength.setter
     def prefixlength(self, arg):
         """prefixlength setter method"""
-        self.network_object = IPv4Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self.prefixlen = arg
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1392,30 +1329,22 @@ class IPv4Obj(object):
     @property
     def broadcast(self):
         """Returns the broadcast address as an :class:`ipaddress.IPv4Address` object."""
-        if sys.version_info[0] < 3:
-            return self.network_object.broadcast
-        else:
-            return self.network_object.broadcast_address
+        return self.network_object.broadcast_address
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def network(self):
         """Returns an :class:`ipaddress.IPv4Network` object, which represents this network."""
-        if sys.version_info[0] < 3:
-            return self.network_object.network
-        else:
-            ## The ipaddress module returns an "IPAddress" object in Python3...
-            return IPv4Network(f"{self.network_object.compressed}")
-
-    # @property
-    # def as_decimal_network(self):
-    #    """Returns an integer calculated from the network address..."""
-    #    num_strings = str(self.network).split(".")
-    #    num_strings.reverse()  # reverse the order
-    #    return sum(
-    #        [int(num, 16) * (65536 ** idx) for idx, num in enumerate(num_strings)]
-    #    )
+        ## network_object is already masked to its network address
+        return self.network_object
+
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @property
+    def network_address(self):
+        """Returns the network address as an :class:`ipaddress.IPv4Address` object."""
+        return self.network_object.network_address
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1450,28 +1379,21 @@ class IPv4Obj(object):
     @property
     def numhosts(self):
         """Returns the total number of IP addresses in this network, including broadcast and the "subnet zero" address"""
-        if sys.version_info[0] < 3:
-            return self.network_object.numhosts
-        else:
-            return 2 ** (IPV4_MAX_PREFIXLEN - self.network_object.prefixlen)
+        return self._numhosts
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def as_decimal(self):
         """Returns the IP address as a decimal integer"""
-        num_strings = str(self.ip).split(".")
-        num_strings.reverse()  # reverse the order
-        return sum(int(num) * (256**idx) for idx, num in enumerate(num_strings))
+        return self._as_decimal
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def as_decimal_network(self):
-        """Returns the IP address as a decimal integer"""
-        num_strings = str(self.network).split("/")[0].split(".")
-        num_strings.reverse()  # reverse the order
-        return sum(int(num) * (256**idx) for idx, num in enumerate(num_strings))
+        """Returns the IP network as a decimal integer"""
+        return self._as_decimal_network
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1485,19 +1407,16 @@ class IPv4Obj(object):
     @property
     def as_zeropadded(self):
         """Returns the IP address as a zero-padded string (useful when sorting in a text-file)"""
-        num_strings = str(self.ip).split(".")
-        return ".".join([f"{int(num):03}" for num in num_strings])
+        b = self.ip_object.packed
+        return "%03d.%03d.%03d.%03d" % (b[0], b[1], b[2], b[3])
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def as_zeropadded_network(self):
         """Returns the IP network as a zero-padded string (useful when sorting in a text-file)"""
-        num_strings = self.as_cidr_net.split("/")[0].split(".")
-        return (
-            ".".join([f"{int(num):03}" for num in num_strings])
-            + "/" + str(self.prefixlen)
-        )
+        b = self.network_object.network_address.packed
+        return "%03d.%03d.%03d.%03d/%d" % (b[0], b[1], b[2], b[3], self._prefixlen)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1511,31 +1430,30 @@ class IPv4Obj(object):
     @property
     def as_binary_tuple(self):
         """Returns the IP address as a tuple of zero-padded binary strings"""
-        return tuple(f"{int(num):08b}" for num in str(self.ip).split("."))
+        b = self.ip_object.packed
+        return (f"{b[0]:08b}", f"{b[1]:08b}", f"{b[2]:08b}", f"{b[3]:08b}")
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def as_hex_tuple(self):
         """Returns the IP address as a tuple of zero-padded hex strings"""
-        return tuple(f"{int(num):02x}" for num in str(self.ip).split("."))
+        b = self.ip_object.packed
+        return ("%02x" % b[0], "%02x" % b[1], "%02x" % b[2], "%02x" % b[3])
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def as_cidr_addr(self):
         """Returns a string with the address in CIDR notation"""
-        return str(self.ip) + "/" + str(self.prefixlen)
+        return f"{self.ip_object}/{self._prefixlen}"
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def as_cidr_net(self):
         """Returns a string with the network in CIDR notation"""
-        if sys.version_info[0] < 3:
-            return str(self.network) + "/" + str(self.prefixlen)
-        else:
-            return str(self.network)
+        return str(self.network_object)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1559,11 +1477,31 @@ class IPv4Obj(object):
         return self.network_object.is_reserved
 
 
+# do NOT wrap with @logger.catch(...)
+@lru_cache(maxsize=_IPOBJ_CACHE_MAXSIZE)
+def _ipv4_from_str(arg, strict):
+    """Build the shared IPv4Obj() instances returned by IPv4Obj.get()"""
+    obj = IPv4Obj(arg, strict=strict)
+    obj._frozen = True
+    return obj
+
+
 # Build a wrapper around ipaddress classes to mimic the behavior of network
 # interfaces (such as persisting host-bits when the intf masklen changes) and
-# add custom @properties
+# add custom @properties; total_ordering derives the other rich comparisons
+# from __eq__() and __lt__()
+@total_ordering
 class IPv6Obj(object):
 
+    # These objects are built in bulk (one per address in a config), so
+    # skip the per-instance __dict__
+    __slots__ = (
+        "arg", "dna", "ip_object", "network_object", "strict", "debug",
+        "_as_decimal", "_as_decimal_network", "_prefixlen", "_numhosts",
+        "_mask_ip", "_net_hi64", "_mask_hi64", "_network_flags",
+        "_frozen",
+    )
+
     # This method is on IPv6Obj().  Do NOT add @logger.catch to __init__()...
     # that breaks it.
     def __init__(self, arg=f"::1/{IPV6_MAX_PREFIXLEN}", strict=False, debug=0):
@@ -1633,84 +1571,176 @@ class IPv6Obj(object):
         self.network_object = None
         self.strict = strict
         self.debug = debug
-        self.params_dict = {}
-
-        # Build params_dict... this needs to work with any supported input...
-        if isinstance(arg, str) or isinstance(arg, int) or isinstance(arg, IPv6Obj):
-            params_dict = self._ipv6_params_dict(arg)
-            self.params_dict = params_dict
+        self._frozen = False
+
+        if isinstance(arg, IPv6Obj):
+            # ipaddress objects are immutable, so share them (and the cached
+            # integers) with arg instead of re-parsing arg as a string
+            self.network_object = arg.network_object
+            self.ip_object = arg.ip_object
+            self._as_decimal = arg._as_decimal
+            self._as_decimal_network = arg._as_decimal_network
+            self._prefixlen = arg._prefixlen
+            self._numhosts = arg._numhosts
+            self._mask_ip = arg._mask_ip
+            self._net_hi64 = arg._net_hi64
+            self._mask_hi64 = arg._mask_hi64
+            # Safe to share; _update_cached_attrs() replaces it rather than
+            # clearing it
+            self._network_flags = arg._network_flags
+            return None
 
         if isinstance(arg, str):
             assert len(arg) <= IPV6_MAXSTR_LEN
-            self.network_object = IPv6Network(params_dict['ip_arg_str'], strict=strict)
-            self.ip_object = IPv6Address(params_dict['ipv6_addr'])
-            return None
+            # Parse the address string exactly once; IPv6Network() gets the
+            # address as an int, because an IPv6Address() in the tuple would
+            # be converted back to a string and parsed again
+            addr, masklen = self._split_addr_mask(arg)
+            self.ip_object = IPv6Address(addr)
+            self.network_object = IPv6Network((int(self.ip_object), masklen), strict=strict)
 
         elif isinstance(arg, int):
             assert 0 <= arg <= IPV6_MAXINT
             self.network_object = IPv6Network(arg, strict=strict)
             self.ip_object = IPv6Address(arg)
-            return None
-
-        elif isinstance(arg, IPv6Obj):
-            ip_str = f"{str(arg.ip_object)}/{arg.prefixlen}"
-            self.network_object = IPv6Network(ip_str, strict=False)
-            self.ip_object = IPv6Address(str(arg.ip_object))
-            return None
 
         elif isinstance(arg, IPv6Network):
             self.network_object = arg
-            self.ip_object = IPv6Address(str(arg).split("/")[0])
-            return None
+            self.ip_object = arg.network_address
 
         elif isinstance(arg, IPv6Address):
-            self.network_object = IPv6Network(str(arg) + "/" + str(IPV6_MAX_PREFIXLEN))
-            self.ip_object = IPv6Address(str(arg).split("/")[0])
-            return None
+            self.network_object = IPv6Network((int(arg), IPV6_MAX_PREFIXLEN))
+            self.ip_object = arg
 
         else:
             raise AddressValueError("IPv6Obj(arg='%s') is an unknown argument type" % (arg))
 
+        self._update_cached_attrs()
+
     # On IPv6Obj()
-    def _ipv6_params_dict(self, arg, debug=0):
+    @classmethod
+    def _from_int_prefix(cls, ip_int, prefixlen):
         """
-        Parse out important IPv6 parameters from arg.  This method must run to
-        completion for IPv6 address parsing to work correctly.
+        Build an IPv6Obj() straight from an integer address and a prefixlen,
+        without parsing (or formatting) any strings.
         """
-        if not isinstance(arg, (str, int, IPv6Obj,)):
-            raise ValueError
+        obj = cls.__new__(cls)
+        obj.arg = ip_int
+        obj.dna = "IPv6Obj"
+        obj.strict = False
+        obj.debug = 0
+        obj._frozen = False
+        obj.ip_object = IPv6Address(ip_int)
+        obj.network_object = IPv6Network((ip_int, prefixlen), strict=False)
+        obj._update_cached_attrs()
+        return obj
 
-        if isinstance(arg, str):
-            try:
-                mm = _RGX_IPV6ADDR.search(arg)
+    # On IPv6Obj()
+    @classmethod
+    def get(cls, arg, strict=False):
+        """
+        Return a cached IPv6Obj() for ``arg``.  This is much faster than
+        IPv6Obj(arg) when the same strings are parsed over and over again.
 
-            except TypeError:
-                raise AddressValueError(
-                    f"_ipv6_params_dict() doesn't know how to parse {arg}"
-                )
+        The returned object is shared by all callers, so it is read-only;
+        changing its prefixlen raises AttributeError.  Copy it with
+        ``IPv6Obj(obj)`` first.
+        """
+        if isinstance(arg, str) and cls is IPv6Obj:
+            return _ipv6_from_str(arg, strict)
+        return cls(arg, strict=strict)
 
+    # On IPv6Obj()
+    def _update_cached_attrs(self):
+        """
+        Cache the integers used by comparisons, hashing and containment
+        checks.  This must be called whenever ip_object or network_object
+        changes.
+        """
+        self._as_decimal = int(self.ip_object)
+        self._as_decimal_network = int(self.network_object.network_address)
+        self._prefixlen = self.network_object.prefixlen
+        self._numhosts = 1 << (IPV6_MAX_PREFIXLEN - self._prefixlen)
+        # The netmask of network_object, as an integer
+        self._mask_ip = IPV6_MAXINT ^ (self._numhosts - 1)
+        # Upper 64 bits of the network and netmask, for the /64 fast path
+        # in __contains__()
+        self._net_hi64 = self._as_decimal_network >> 64
+        self._mask_hi64 = self._mask_ip >> 64
+        # Memoized network_object.is_* results; these depend on the
+        # prefixlen, so they are dropped whenever network_object changes.
+        # _network_flag() builds the dict on first use
+        self._network_flags = None
 
-            ERROR = f"_ipv6_params_dict() couldn't parse '{arg}'"
-            assert mm is not None, ERROR
+    # On IPv6Obj()
+    def _network_flag(self, name):
+        """Return network_object.<name>, computing it at most once"""
+        flags = self._network_flags
+        if flags is None:
+            flags = self._network_flags = {}
+        try:
+            return flags[name]
+        except KeyError:
+            # Keyed by name (not by the property object) so this object
+            # still pickles
+            retval = flags[name] = getattr(self.network_object, name)
+            return retval
 
-            mm_result = mm.groupdict()
-            try:
-                addr = mm_result["addr"]
+    # On IPv6Obj()
+    @staticmethod
+    def _split_addr_mask(arg):
+        """
+        Split an IPv6 address string into an (addr, masklen) tuple.
+        Supported formats: "2001::1", "2001::1/64" and "2001::1 64", with an
+        optional %scope suffix on the address.  addr only gets a cheap
+        character check here; IPv6Address() validates it.
+        """
+        ERROR = f"IPv6Obj() couldn't parse '{arg}'"
+
+        parts = arg.replace("/", " ").split()
+        if not (1 <= len(parts) <= 2):
+            raise AddressValueError(ERROR)
+        # Drop any %scope suffix (i.e. fe80::1%eth0); IPv6Obj() has never
+        # kept the scope, and IPv6Address() only accepts it on Python 3.9+
+        addr = parts[0].partition("%")[0]
+
+        if ":" not in addr or not _IPV6_ADDR_CHARS.issuperset(addr):
+            raise AddressValueError(ERROR)
+
+        if len(parts) == 2:
+            if not parts[1].isdigit():
+                raise AddressValueError(ERROR)
+            masklen = int(parts[1])
+        else:
+            masklen = IPV6_MAX_PREFIXLEN
 
-            except Exception:
-                addr = "::1"
+        if masklen > IPV6_MAX_PREFIXLEN:
+            raise ValueError
 
-            try:
-                masklen = int(mm_result['masklen'])
-            except Exception:
-                masklen = IPV6_MAX_PREFIXLEN
+        return addr, masklen
 
-            if not (isinstance(masklen, int) and masklen <= 128):
-                raise ValueError
+    # On IPv6Obj()
+    @property
+    def params_dict(self):
+        """Return a dict of the parsed IPv6 parameters of this object"""
+        return self._ipv6_params_dict(self)
+
+    # On IPv6Obj()
+    def _ipv6_params_dict(self, arg, debug=0):
+        """
+        Parse out important IPv6 parameters from arg.  This backs the
+        params_dict property; __init__() does not call it.
+        """
+        if not isinstance(arg, (str, int, IPv6Obj,)):
+            raise ValueError
+
+        if isinstance(arg, str):
+            addr, masklen = self._split_addr_mask(arg)
+            addr = str(IPv6Address(addr))
 
             # If we have to derive the netmask as a long hex string,
             # calculate the netmask from the masklen as follows...
-            netmask_int = (2**128 - 1) - (2**(128 - masklen) - 1)
+            netmask_int = IPV6_MAXINT ^ ((1 << (IPV6_MAX_PREFIXLEN - masklen)) - 1)
             netmask = str(IPv6Address(netmask_int))
 
         elif isinstance(arg, int):
@@ -1732,7 +1762,7 @@ class IPv6Obj(object):
         params_dict = {
             'ipv6_addr': addr,
             'ip_version': 6,
-            'ip_arg_str': str(addr) + "/" + str(masklen),
+            'ip_arg_str': f"{addr}/{masklen}",
             'netmask': netmask,
             'masklen': masklen,
         }
@@ -1749,119 +1779,45 @@ class IPv6Obj(object):
     def __repr__(self):
         # Detect IPv4_mapped IPv6 addresses...
         if self.is_ipv4_mapped:
-            return """<IPv6Obj ::ffff:{}/{}>""".format(
-                str(self.ip.ipv4_mapped), self.prefixlen
-            )
+            return f"""<IPv6Obj ::ffff:{self.ip_object.ipv4_mapped}/{self._prefixlen}>"""
         else:
-            return f"""<IPv6Obj {str(self.ip)}/{self.prefixlen}>"""
+            return f"""<IPv6Obj {self.ip_object}/{self._prefixlen}>"""
 
     # On IPv6Obj()
     def __eq__(self, val):
-        try:
-            for obj in [self, val]:
-                for attr_name in ["as_decimal", "prefixlen"]:
-                    try:
-                        assert getattr(obj, attr_name, None) is not None
-                    except AssertionError:
-                        return False
-
-            # Compare objects numerically...
-            if self.as_decimal == val.as_decimal and self.prefixlen == val.prefixlen:
-                return True
-            return False
-        except (Exception) as e:
-            errmsg = "'{}' cannot compare itself to '{}': {}".format(
-                self.__repr__(), val, e
-            )
-            raise ValueError(errmsg)
-
-    # On IPv6Obj()
-    def __ne__(self, val):
-        return not self.__eq__(val)
-
-    # On IPv6Obj()
-    def __gt__(self, val):
-        try:
-            for obj in [self, val]:
-                for attr_name in ["as_decimal", "as_decimal_network", "prefixlen"]:
-                    try:
-                        assert getattr(obj, attr_name, None) is not None
-                    except (AssertionError):
-                        error_str = "Cannot compare {} with '{}'".format(
-                            self, type(obj)
-                        )
-                        raise AssertionError(error_str)
-
-            val_prefixlen = int(getattr(val, "prefixlen"))
-            self_prefixlen = int(getattr(self, "prefixlen"))
-            val_ndec = int(getattr(val, "as_decimal_network"))
-            self_ndec = int(getattr(self, "as_decimal_network"))
-            val_dec = int(getattr(val, "as_decimal"))
-            self_dec = int(getattr(self, "as_decimal"))
-
-            if self_ndec == val_ndec and self_prefixlen == val_prefixlen:
-                return self_dec > val_dec
-
-            # for the same network, longer prefixlens sort "higher" than shorter prefixlens
-            elif self_ndec == val_ndec:
-                return self_prefixlen > val_prefixlen
+        if val is self:
+            return True
 
-            else:
-                return self_ndec > val_ndec
+        # Let python fall back to False for other types, i.e. Github issue #180;
+        # python also derives __ne__() from this method
+        if not isinstance(val, IPv6Obj):
+            return NotImplemented
 
-        except Exception:
-            errmsg = f"{self.__repr__()} cannot compare itself to '{val}'"
-            raise ValueError(errmsg)
+        return self._as_decimal == val._as_decimal and self._prefixlen == val._prefixlen
 
     # On IPv6Obj()
     def __lt__(self, val):
-        try:
-            for obj in [self, val]:
-                for attr_name in ["as_decimal", "prefixlen"]:
-                    try:
-                        assert getattr(obj, attr_name, None) is not None
-                    except (AssertionError):
-                        error_str = "Cannot compare {} with '{}'".format(
-                            self, type(obj)
-                        )
-                        raise AssertionError(error_str)
-
-            val_prefixlen = int(getattr(val, "prefixlen"))
-            self_prefixlen = int(getattr(self, "prefixlen"))
-            val_ndec = int(getattr(val, "as_decimal_network"))
-            self_ndec = int(getattr(self, "as_decimal_network"))
-            val_dec = int(getattr(val, "as_decimal"))
-            self_dec = int(getattr(self, "as_decimal"))
-
-            if self_ndec == val_ndec and self_prefixlen == val_prefixlen:
-                return self_dec < val_dec
-
-            # for the same network, longer prefixlens sort "higher" than shorter prefixlens
-            elif self_ndec == val_ndec:
-                return self_prefixlen < val_prefixlen
-
-            else:
-                return self_ndec < val_ndec
+        if isinstance(val, IPv6Obj):
+            val_key = (val._as_decimal_network, val._prefixlen, val._as_decimal)
+        else:
+            try:
+                val_key = (val.as_decimal_network, val.prefixlen, val.as_decimal)
+            except AttributeError:
+                errmsg = f"{self.__repr__()} cannot compare itself to '{val}'"
+                raise ValueError(errmsg)
 
-        except Exception:
-            errmsg = f"{self.__repr__()} cannot compare itself to '{val}'"
-            raise ValueError(errmsg)
+        # for the same network, longer prefixlens sort "higher" than shorter prefixlens
+        return (self._as_decimal_network, self._prefixlen, self._as_decimal) < val_key
 
     # On IPv6Obj()
     def __int__(self):
         """Return this object as an integer"""
-        if getattr(self, "as_decimal", None) is not None:
-            return self.as_decimal
-        else:
-            return False
+        return self._as_decimal
 
     # On IPv6Obj()
     def __index__(self):
         """Return this object as an integer (used for hex() and bin() operations)"""
-        if getattr(self, "as_decimal", None) is not None:
-            return self.as_decimal
-        else:
-            return False
+        return self._as_decimal
 
     # On IPv6Obj()
     def __add__(self, val):
@@ -1869,13 +1825,11 @@ class IPv6Obj(object):
         if not isinstance(val, int):
             raise ValueError("Cannot add type: '{}' to {}".format(type(val), self))
 
-        orig_prefixlen = self.prefixlen
-        total = self.as_decimal + val
+        orig_prefixlen = self._prefixlen
+        total = self._as_decimal + val
         assert total <= IPV6_MAXINT, "Max IPv6 integer exceeded"
         assert total >= 0, "Min IPv6 integer exceeded"
-        retval = IPv6Obj(total)
-        retval.prefixlen = orig_prefixlen
-        return retval
+        return IPv6Obj._from_int_prefix(total, orig_prefixlen)
 
     # On IPv6Obj()
     def __sub__(self, val):
@@ -1883,49 +1837,49 @@ class IPv6Obj(object):
         if not isinstance(val, int):
             raise ValueError("Cannot subtract type: '{}' from {}".format(type(val), self))
 
-        orig_prefixlen = self.prefixlen
-        total = self.as_decimal - val
+        orig_prefixlen = self._prefixlen
+        total = self._as_decimal - val
         assert total < IPV6_MAXINT, "Max IPv6 integer exceeded"
         assert total >= 0, "Min IPv6 integer exceeded"
-        retval = IPv6Obj(total)
-        retval.prefixlen = orig_prefixlen
-        return retval
+        return IPv6Obj._from_int_prefix(total, orig_prefixlen)
 
     # On IPv6Obj()
     def __contains__(self, val):
         # Used for "foo in bar"... python calls bar.__contains__(foo)
-        try:
-            if self.network_object.prefixlen == 0:
-                return True
-            elif self.network_object.prefixlen > val.network_object.prefixlen:
-                # obvious shortcut... if this object's mask is longer than
-                #    val, this object cannot contain val
-                return False
-            else:
-                # NOTE: We cannot use the same algorithm as IPv4Obj.__contains__() because IPv6Obj doesn't have .broadcast
-                # return (val.network in self.network)
-                #
-                ## Last used: 2020-07-12... version 1.5.6
-                # return (self.network <= val.network) and (
-                #    (self.as_decimal + self.numhosts - 1)
-                #    >= (val.as_decimal + val.numhosts - 1)
-                # )
-                return (self.as_decimal_network <= val.as_decimal_network) and (
-                    (self.as_decimal_network + self.numhosts - 1)
-                    >= (val.as_decimal_network + val.numhosts - 1)
-                )
+        if isinstance(val, IPv6Obj):
+            val_prefixlen = val._prefixlen
+            val_net = val._as_decimal_network
+        else:
+            # Only a missing network_object means val is the wrong type;
+            # don't hide anything else behind a broad except
+            try:
+                val_network = val.network_object
+            except AttributeError as e:
+                raise ValueError(
+                    "Could not check whether '{}' is contained in '{}': {}".format(
+                        val, self, e
+                    )
+                ) from None
+            val_prefixlen = val_network.prefixlen
+            val_net = int(val_network.network_address)
 
-        except (Exception) as e:
-            raise ValueError(
-                "Could not check whether '{}' is contained in '{}': {}".format(
-                    val, self, e
-                )
-            )
+        if self._prefixlen > val_prefixlen:
+            # obvious shortcut... if this object's mask is longer than
+            #    val, this object cannot contain val
+            return False
+        elif self._prefixlen <= 64:
+            # /64 and shorter only care about the upper 64 bits, which
+            # keeps the masking in small ints
+            return ((val_net >> 64) & self._mask_hi64) == self._net_hi64
+        else:
+            # val is inside this network if masking val's network
+            # address with our netmask gives our network address
+            return (val_net & self._mask_ip) == self._as_decimal_network
 
     # On IPv6Obj()
     def __hash__(self):
         # Python3 needs __hash__()
-        return hash(str(self.ip_object)) + hash(str(self.prefixlen))
+        return hash((self._as_decimal, self._prefixlen))
 
     # On IPv6Obj()
     def __iter__(self):
@@ -1936,11 +1890,6 @@ class IPv6Obj(object):
         ## For Python3 iteration...
         return self.network_object.__next__()
 
-    # On IPv6Obj()
-    def next(self):
-        ## For Python2 iteration...
-        return self.network_object.__next__()
-
     # On IPv6Obj()
     @staticmethod
     def get_regex():
@@ -1954,14 +1903,6 @@ class IPv6Obj(object):
         """
         return self.version
 
-    # On IPv6Obj()
-    @property
-    def _prefixlen(self):
-        """
-        Fix github issue #203... build a `_prefixlen` attribute...
-        """
-        return self.prefixlen
-
     # On IPv6Obj()
     @property
     def _max_prefixlen(self):
@@ -1979,16 +1920,15 @@ class IPv6Obj(object):
         # ref RFC 5156 - Section 2.2 IPv4 mapped addresses
         #     https://datatracker.ietf.org/doc/html/rfc5156#section-2.2
         #
-        # if self.ip in IPv6Network("::ffff:0:0/96", strict=False):
-        if IPv6Network("::ffff:0:0/96").__contains__(self.ip):
-            return True
-        return False
+        # i.e. self.ip in IPv6Network("::ffff:0:0/96"), without building
+        # the IPv6Network() on every call
+        return (self._as_decimal >> 32) == 0xffff
 
     # On IPv6Obj()
     @property
     def _ip(self):
         """Returns the address as an integer.  This property exists for compatibility with ipaddress.IPv6Address() in stdlib"""
-        return int(self.ip_object)
+        return self._as_decimal
 
     # On IPv6Obj()
     @property
@@ -2006,49 +1946,51 @@ class IPv6Obj(object):
     @property
     def masklen(self):
         """Returns the length of the network mask as an integer."""
-        return int(self.network_object.prefixlen)
+        return self._prefixlen
 
     # On IPv6Obj()
     @masklen.setter
     def masklen(self, arg):
         """masklen setter method"""
-        self.network_object = IPv6Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self.prefixlen = arg
 
     # On IPv6Obj()
     @property
     def masklength(self):
         """Returns the length of the network mask as an integer."""
-        return self.prefixlen
+        return self._prefixlen
 
     # On IPv6Obj()
     @masklength.setter
     def masklength(self, arg):
         """masklength setter method"""
-        self.network_object = IPv6Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self.prefixlen = arg
 
     # On IPv6Obj()
     @property
     def prefixlen(self):
         """Returns the length of the network mask as an integer."""
-        return int(self.network_object.prefixlen)
+        return self._prefixlen
 
     # On IPv6Obj()
     @prefixlen.setter
     def prefixlen(self, arg):
         """prefixlen setter method"""
-        self.network_object = IPv6Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        if self._frozen:
+            raise AttributeError(
+                f"{self!r} is shared by IPv6Obj.get(); copy it with "
+                "IPv6Obj(obj) before changing it"
+            )
+        # The (int, prefixlen) tuple form skips the IPv6 string parser
+        self.network_object = IPv6Network((self._as_decimal, int(arg)), strict=False)
+        # Refresh _as_decimal_network, _mask_ip, etc...
+        self._update_cached_attrs()
 
     # On IPv6Obj()
     @property
     def prefixlength(self):
         """Returns the length of the network mask as an integer."""
-        return self.prefixlen
+        return self._prefixlen
 
     # On IPv6Obj()
     @property
@@ -2077,18 +2019,20 @@ class IPv6Obj(object):
     @property
     def network(self):
         """Returns an :class:`ipaddress.IPv6Network` object, which represents this network."""
-        ## The ipaddress module returns an "IPAddress" object in Python3...
-        return IPv6Network(f"{self.network_object.compressed}")
+        ## network_object is already masked to its network address
+        return self.network_object
+
+    # On IPv6Obj()
+    @property
+    def network_address(self):
+        """Returns the network address as an :class:`ipaddress.IPv6Address` object."""
+        return self.network_object.network_address
 
     # On IPv6Obj()
     @property
     def as_decimal_network(self):
         """Returns the IP network as a decimal integer"""
-        num_strings = str(self.network.exploded).split("/")[0].split(":")
-        num_strings.reverse()  # reverse the order
-        return sum(
-            int(num, 16) * (65536**idx) for idx, num in enumerate(num_strings)
-        )
+        return self._as_decimal_network
 
     # On IPv6Obj()
     @property
@@ -2118,20 +2062,13 @@ class IPv6Obj(object):
     @property
     def numhosts(self):
         """Returns the total number of IP addresses in this network, including broadcast and the "subnet zero" address"""
-        if sys.version_info[0] < 3:
-            return self.network_object.numhosts
-        else:
-            return 2 ** (IPV6_MAX_PREFIXLEN - self.network_object.prefixlen)
+        return self._numhosts
 
     # On IPv6Obj()
     @property
     def as_decimal(self):
         """Returns the IP address as a decimal integer"""
-        num_strings = str(self.ip.exploded).split(":")
-        num_strings.reverse()  # reverse the order
-        return sum(
-            int(num, 16) * (65536**idx) for idx, num in enumerate(num_strings)
-        )
+        return self._as_decimal
 
     # On IPv6Obj()
     def as_int(self):
@@ -2142,8 +2079,8 @@ class IPv6Obj(object):
     @property
     def as_binary_tuple(self):
         """Returns the IPv6 address as a tuple of zero-padded 16-bit binary strings"""
-        result_list = [f"{int(ii, 16):016b}" for ii in self.as_hex_tuple]
-        return tuple(result_list)
+        b = self.ip_object.packed
+        return tuple(f"{b[ii]:08b}{b[ii + 1]:08b}" for ii in range(0, 16, 2))
 
     # On IPv6Obj()
     @property
@@ -2155,60 +2092,57 @@ class IPv6Obj(object):
     @property
     def as_hex_tuple(self):
         """Returns the IPv6 address as a tuple of zero-padded 16-bit hex strings"""
-        result_list = str(self.ip.exploded).split(":")
-        return tuple(result_list)
+        b = self.ip_object.packed
+        return tuple("%02x%02x" % (b[ii], b[ii + 1]) for ii in range(0, 16, 2))
 
     # On IPv6Obj()
     @property
     def as_cidr_addr(self):
         """Returns a string with the address in CIDR notation"""
-        return str(self.ip) + "/" + str(self.prefixlen)
+        return f"{self.ip_object}/{self._prefixlen}"
 
     # On IPv6Obj()
     @property
     def as_cidr_net(self):
         """Returns a string with the network in CIDR notation"""
-        if sys.version_info[0] < 3:
-            return str(self.network) + "/" + str(self.prefixlen)
-        else:
-            return str(self.network)
+        return str(self.network_object)
 
     # On IPv6Obj()
     @property
     def is_multicast(self):
         """Returns a boolean for whether this is a multicast address"""
-        return self.network_object.is_multicast
+        return self._network_flag("is_multicast")
 
     # On IPv6Obj()
     @property
     def is_private(self):
         """Returns a boolean for whether this is a private address"""
-        return self.network_object.is_private
+        return self._network_flag("is_private")
 
     # On IPv6Obj()
     @property
     def is_reserved(self):
         """Returns a boolean for whether this is a reserved address"""
-        return self.network_object.is_reserved
+        return self._network_flag("is_reserved")
 
     # On IPv6Obj()
     @property
     def is_link_local(self):
         """Returns a boolean for whether this is an IPv6 link-local address"""
-        return self.network_object.is_link_local
+        return self._network_flag("is_link_local")
 
     # On IPv6Obj()
     @property
     def is_site_local(self):
         """Returns a boolean for whether this is an IPv6 site-local address"""
-        return self.network_object.is_site_local
+        return self._network_flag("is_site_local")
 
     # On IPv6Obj()
     @property
     def is_unspecified(self):
         """Returns a boolean for whether this address is not otherwise
         classified"""
-        return self.network_object.is_unspecified
+        return self._network_flag("is_unspecified")
 
     # On IPv6Obj()
     @property
@@ -2221,6 +2155,59 @@ class IPv6Obj(object):
         return self.network_object.sixtofour
 
 
+# do NOT wrap with @logger.catch(...)
+@lru_cache(maxsize=_IPOBJ_CACHE_MAXSIZE)
+def _ipv6_from_str(arg, strict):
+    """Build the shared IPv6Obj() instances returned by IPv6Obj.get()"""
+    obj = IPv6Obj(arg, strict=strict)
+    obj._frozen = True
+    return obj
+
+
+class _NeqPortList(Sequence):
+    """
+    A lazy, sorted sequence of all ports from 1 to 65535 except
+    `excluded_port`.  L4Object() uses this for 'neq' port_specs instead of
+    building a 65534-element list.
+    """
+
+    __slots__ = ("excluded_port",)
+
+    def __init__(self, excluded_port):
+        self.excluded_port = excluded_port
+
+    def __len__(self):
+        return 65534
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[ii] for ii in range(*idx.indices(65534))]
+
+        if idx < 0:
+            idx += 65534
+        if not (0 <= idx < 65534):
+            raise IndexError("_NeqPortList index out of range")
+
+        port = idx + 1
+        return port if port < self.excluded_port else port + 1
+
+    def __contains__(self, port):
+        return isinstance(port, int) and 1 <= port <= 65535 and port != self.excluded_port
+
+    def __iter__(self):
+        return chain(range(1, self.excluded_port), range(self.excluded_port + 1, 65536))
+
+    def __eq__(self, val):
+        if isinstance(val, _NeqPortList):
+            return self.excluded_port == val.excluded_port
+        elif isinstance(val, Sequence):
+            return len(val) == 65534 and list(self) == list(val)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"<_NeqPortList all ports except {self.excluded_port}>"
+
+
 class L4Object(object):
     """Object for Transport-layer protocols; the object ensures that logical operators (such as le, gt, eq, and ne) are parsed correctly, as well as mapping service names to port numbers
 
@@ -2259,37 +2246,38 @@ class L4Object(object):
         else:
             raise NotImplementedError(f"This syntax is unknown: '{syntax}'")
 
-        if "eq " in port_spec.strip():
-            port_tmp = re.split(r"\s+", port_spec)[-1].strip()
+        # Check 'neq ' before 'eq ', which is a substring of it
+        if "neq " in port_spec.strip():
+            port_tmp = _RGX_WHITESPACE.split(port_spec)[-1]
+            neq_port = int(ports.get(port_tmp, port_tmp))
+            assert 1 <= neq_port <= 65535
+            self.port_list = _NeqPortList(neq_port)
+        elif "eq " in port_spec.strip():
+            port_tmp = _RGX_WHITESPACE.split(port_spec)[-1].strip()
             eq_port = int(ports.get(port_tmp, port_tmp))
             assert 1 <= eq_port <= 65535
             self.port_list = [eq_port]
-        elif re.search(r"^\S+$", port_spec.strip()):
+        elif _RGX_SINGLE_WORD.search(port_spec.strip()):
             # Technically, 'eq ' is optional...
             eq_port = int(ports.get(port_spec.strip(), port_spec.strip()))
             assert 1 <= eq_port <= 65535
             self.port_list = [eq_port]
         elif "range " in port_spec.strip():
-            port_tmp = re.split(r"\s+", port_spec)[1:]
+            port_tmp = _RGX_WHITESPACE.split(port_spec)[1:]
             low_port = int(ports.get(port_tmp[0], port_tmp[0]))
             high_port = int(ports.get(port_tmp[1], port_tmp[1]))
             assert low_port <= high_port
             self.port_list = sorted(range(low_port, high_port + 1))
         elif "lt " in port_spec.strip():
-            port_tmp = re.split(r"\s+", port_spec)[-1]
+            port_tmp = _RGX_WHITESPACE.split(port_spec)[-1]
             high_port = int(ports.get(port_tmp, port_tmp))
             assert 65536 >= high_port >= 2
             self.port_list = sorted(range(1, high_port))
         elif "gt " in port_spec.strip():
-            port_tmp = re.split(r"\s+", port_spec)[-1]
+            port_tmp = _RGX_WHITESPACE.split(port_spec)[-1]
             low_port = int(ports.get(port_tmp, port_tmp))
             assert 0 < low_port < 65535
             self.port_list = sorted(range(low_port + 1, 65536))
-        elif "neq " in port_spec.strip():
-            port_str = re.split(r"\s+", port_spec)[-1]
-            tmp = set(range(1, 65536))
-            tmp.remove(int(port_str))
-            self.port_list = sorted(tmp)
         else:
             raise NotImplementedError(
                 f"This port_spec is unknown: '{port_spec}'"
@@ -2356,13 +2344,51 @@ class DNSResponse(object):
 
     def __repr__(self):
         if not self.has_error:
-            return '<DNSResponse "{}" result_str="{}">'.format(
-                self.query_type, self.result_str
-            )
+            return f'<DNSResponse "{self.query_type}" result_str="{self.result_str}">'
         else:
-            return '<DNSResponse "{}" error="{}">'.format(
-                self.query_type, self.error_str
-            )
+            return f'<DNSResponse "{self.query_type}" error="{self.error_str}">'
+
+
+_DNS = None
+_RESOLVER = None
+
+
+def _get_dns():
+    """Import dnspython the first time a DNS helper needs it, and return the dns package.  Most ciscoconfparse users never do DNS lookups, so they should not pay for importing dnspython."""
+    global _DNS
+    if _DNS is None:
+        import dns.exception
+        import dns.resolver
+        import dns.query
+        import dns.zone
+        _DNS = dns
+    return _DNS
+
+
+def _get_resolver():
+    """Return a copy of the shared dnspython Resolver; the shared Resolver reads /etc/resolv.conf once, the first time it is needed.  Callers get a copy so their timeout / nameserver changes stay local to that call."""
+    global _RESOLVER
+    if _RESOLVER is None:
+        _RESOLVER = _get_dns().resolver.Resolver()
+    return copy.copy(_RESOLVER)
+
+
+@lru_cache(maxsize=256)
+def _resolve_server_ip(server):
+    """Return the IP address of DNS server `server`; cached, because socket.gethostbyname() is itself a DNS lookup when `server` is a hostname."""
+    return socket.gethostbyname(server)
+
+
+# Map each dns_query() record type to the rdata attribute with its result
+_DNS_RESULT_ATTRS = {
+    "A": "address",
+    "AAAA": "address",
+    "CNAME": "target",
+    "MX": "target",
+    "NS": "target",
+    "PTR": "target",
+    "TXT": "strings",
+}
 
 
 @logger.catch(reraise=True)
@@ -2405,156 +2431,55 @@ def dns_query(input_str="", query_type="", server="", timeout=2.0):
     assert float(timeout) > 0
     assert input_str != ""
     # input = input_str.strip()
+    dns = _get_dns()
     retval = set()
-    rr = Resolver()
-    rr.server = [socket.gethostbyname(server)]
+    rr = _get_resolver()
+    rr.nameservers = [_resolve_server_ip(server)]
     rr.timeout = float(timeout)
     rr.lifetime = float(timeout)
     start = time.time()
-    if (query_type == "A") or (query_type == "AAAA"):
-        try:
-            answer = query(input_str, query_type)
-            duration = time.time() - start
-            for result in answer:
-                response = DNSResponse(
-                    query_type=query_type,
-                    duration=duration,
-                    input_str=input_str,
-                    result_str=str(result.address),
-                )
-                retval.add(response)
-        except DNSException as e:
-            duration = time.time() - start
-            response = DNSResponse(
-                input_str=input_str, duration=duration, query_type=query_type
-            )
-            response.has_error = True
-            response.error_str = e
-            retval.add(response)
-    elif query_type == "AXFR":
+    if query_type == "AXFR":
         """This is a hack: return text of zone transfer, instead of axfr objs"""
-        _zone = zone.from_xfr(query.xfr(server, input_str, lifetime=timeout))
+        _zone = dns.zone.from_xfr(dns.query.xfr(server, input_str, lifetime=timeout))
         return [_zone[node].to_text(node) for node in _zone.nodes.keys()]
-    elif query_type == "CNAME":
-        try:
-            answer = rr.query(input_str, query_type)
-            duration = time.time() - start
-            for result in answer:
-                response = DNSResponse(
-                    query_type=query_type,
-                    duration=duration,
-                    input_str=input_str,
-                    result_str=str(result.target),
-                )
-                retval.add(response)
-        except DNSException as e:
-            duration = time.time() - start
-            response = DNSResponse(
-                input_str=input_str, duration=duration, query_type=query_type
-            )
-            response.has_error = True
-            response.error_str = e
-            retval.add(response)
-    elif query_type == "MX":
-        try:
-            answer = rr.query(input_str, query_type)
-            duration = time.time() - start
-            for result in answer:
-                response = DNSResponse(
-                    query_type=query_type,
-                    input_str=input_str,
-                    result_str=str(result.target),
-                )
-                response.preference = int(result.preference)
-                retval.add(response)
-        except DNSException as e:
-            duration = time.time() - start
-            response = DNSResponse(
-                input_str=input_str, duration=duration, query_type=query_type
-            )
-            response.has_error = True
-            response.error_str = e
-            retval.add(response)
-    elif query_type == "NS":
-        try:
-            answer = rr.query(input_str, query_type)
-            duration = time.time() - start
-            for result in answer:
-                response = DNSResponse(
-                    query_type=query_type,
-                    duration=duration,
-                    input_str=input_str,
-                    result_str=str(result.target),
-                )
-                retval.add(response)
-        except DNSException as e:
-            duration = time.time() - start
-            response = DNSResponse(
-                input_str=input_str, duration=duration, query_type=query_type
-            )
-            response.has_error = True
-            response.error_str = e
-            retval.add(response)
-    elif query_type == "PTR":
 
-        try:
-            IPv4Address(input_str)
-            is_valid_v4 = True
-        except Exception:
-            is_valid_v4 = False
+    elif query_type == "PTR":
 
         try:
-            IPv6Address(input_str)
-            is_valid_v6 = True
-        except Exception:
-            is_valid_v6 = False
+            # i.e. '4.3.2.1.in-addr.arpa.' for '1.2.3.4'
+            query_str = ip_address(input_str).reverse_pointer + "."
+        except ValueError:
+            if "in-addr.arpa" in input_str.lower():
+                query_str = input_str
+            else:
+                raise ValueError(f'Cannot query PTR record for "{input_str}"') from None
 
-        if (is_valid_v4 is True) or (is_valid_v6 is True):
-            inaddr = reversename.from_address(input_str)
-        elif "in-addr.arpa" in input_str.lower():
-            inaddr = input_str
-        else:
-            raise ValueError(f'Cannot query PTR record for "{input_str}"')
+    else:
+        query_str = input_str
 
-        try:
-            answer = rr.query(inaddr, query_type)
-            duration = time.time() - start
-            for result in answer:
-                response = DNSResponse(
-                    query_type=query_type,
-                    duration=duration,
-                    input_str=inaddr,
-                    result_str=str(result.target),
-                )
-                retval.add(response)
-        except DNSException as e:
-            duration = time.time() - start
-            response = DNSResponse(
-                input_str=input_str, duration=duration, query_type=query_type
-            )
-            response.has_error = True
-            response.error_str = e
-            retval.add(response)
-    elif query_type == "TXT":
-        try:
-            answer = rr.query(input_str, query_type)
-            duration = time.time() - start
-            for result in answer:
-                response = DNSResponse(
-                    query_type=query_type,
-                    duration=duration,
-                    input_str=inaddr,
-                    result_str=str(result.strings),
-                )
-                retval.add(response)
-        except DNSException as e:
-            duration = time.time() - start
+    # The rdata attribute that holds the result of each record type...
+    result_attr = _DNS_RESULT_ATTRS[query_type]
+    try:
+        answer = rr.query(query_str, query_type)
+        duration = time.time() - start
+        for result in answer:
             response = DNSResponse(
-                input_str=input_str, duration=duration, query_type=query_type
+                query_type=query_type,
+                duration=duration,
+                input_str=query_str,
+                result_str=str(getattr(result, result_attr)),
             )
-            response.has_error = True
-            response.error_str = e
+            if query_type == "MX":
+                response.preference = int(result.preference)
             retval.add(response)
+    except dns.exception.DNSException as e:
+        duration = time.time() - start
+        response = DNSResponse(
+            input_str=input_str, duration=duration, query_type=query_type
+        )
+        response.has_error = True
+        response.error_str = e
+        retval.add(response)
     return retval
 
 
@@ -2575,7 +2500,8 @@ def dns_lookup(input_str, timeout=3, server="", record_type="A"):
         raise ValueError
 
 
-    rr = Resolver()
+    dns = _get_dns()
+    rr = _get_resolver()
     rr.timeout = float(timeout)
     rr.lifetime = float(timeout)
     if server != "":
@@ -2603,7 +2529,7 @@ def dns_lookup(input_str, timeout=3, server="", record_type="A"):
             "error": "",
             "name": input_str,
         }
-    except DNSException as e:
+    except dns.exception.DNSException as e:
         return {
             "record_type": record_type,
             "addrs": [],
@@ -2616,7 +2542,8 @@ def dns_lookup(input_str, timeout=3, server="", record_type="A"):
 @deprecat(reason="dns6_lookup() is obsolete; use dns_query() instead.  dns6_lookup() will be removed", version='1.7.0')
 def dns6_lookup(input_str, timeout=3, server=""):
     """Perform a simple DNS lookup, return results in a dictionary"""
-    rr = Resolver()
+    dns = _get_dns()
+    rr = _get_resolver()
     rr.timeout = float(timeout)
     rr.lifetime = float(timeout)
     if server:
@@ -2628,7 +2555,7 @@ def dns6_lookup(input_str, timeout=3, server=""):
             "error": "",
             "name": input_str,
         }
-    except DNSException as e:
+    except dns.exception.DNSException as e:
         return {
             "addrs": [],
             "error": repr(e),
@@ -2636,9 +2563,6 @@ def dns6_lookup(input_str, timeout=3, server=""):
         }
 
 
-_REVERSE_DNS_REGEX = re.compile(r"^\s*\d+\.\d+\.\d+\.\d+\s*$")
-
-
 @logger.catch(reraise=True)
 def check_valid_ipaddress(input_addr=None):
     """
@@ -2653,18 +2577,19 @@ def check_valid_ipaddress(input_addr=None):
 
     input_addr = input_addr.strip()
     ipaddr_family = 0
-    try:
-        IPv4Obj(input_addr)
-        ipaddr_family = 4
-    except Exception:
-        pass
-
-    if ipaddr_family == 0:
+    for family, addr_class, obj_class in ((4, IPv4Address, IPv4Obj), (6, IPv6Address, IPv6Obj)):
         try:
-            IPv6Obj(input_addr)
-            ipaddr_family = 6
-        except Exception:
-            pass
+            # A plain address only needs the (C-level) ipaddress check...
+            addr_class(input_addr)
+        except ValueError:
+            # ... anything else, such as an address with a mask, must parse
+            # as an IPv4Obj() / IPv6Obj()
+            try:
+                obj_class.get(input_addr)
+            except Exception:
+                continue
+        ipaddr_family = family
+        break
 
     error = "FATAL: '{0}' is not a valid IPv4 or IPv6 address.".format(input_addr)
     assert (ipaddr_family == 4 or ipaddr_family == 6), error
@@ -2682,13 +2607,22 @@ def reverse_dns_lookup(input_str, timeout=3.0, server="4.2.2.2", proto="udp"):
         raise ValueError
 
 
-    addr, addr_family = check_valid_ipaddress(input_str)
-    assert addr_family==4 or addr_family==6
+    if not isinstance(input_str, str):
+        raise ValueError
+
+    # ip_address() validates octets in C; a PTR query needs a bare address,
+    # so reject prefixes here instead of failing inside dns_query()
+    addr = input_str.strip()
+    try:
+        ip_address(addr)
+    except ValueError:
+        raise AssertionError(
+            f"'{input_str}' is not a valid IPv4 or IPv6 address") from None
 
     if proto!="tcp" and proto!="udp":
         raise ValueError()
 
-    raw_result = dns_query(input_str, query_type="PTR", server=server, timeout=timeout)
+    raw_result = dns_query(addr, query_type="PTR", server=server, timeout=timeout)
     if not isinstance(raw_result, set):
         raise ValueError
 
@@ -2745,6 +2679,20 @@ class CiscoRange(MutableSequence):
             self.slot_prefix = ""
             self._list = list()
 
+    @property
+    def _list(self):
+        # insert() only appends to _items; dedup and sort once, when the
+        #    values are next read
+        if self._dirty:
+            self._items = sorted(map(self.result_type, set(self._items)))
+            self._dirty = False
+        return self._items
+
+    @_list.setter
+    def _list(self, val):
+        self._items = val
+        self._dirty = False
+
     def __repr__(self):
         if len(self._list) == 0:
             return """<CiscoRange []>"""
@@ -2776,16 +2724,17 @@ class CiscoRange(MutableSequence):
         return cmp1 and cmp2
 
     def insert(self, ii, val):
-        ## Insert something at index ii
+        ## Insert something at index ii... the values are sorted anyway, so
+        ##    ii only matters until the next read of _list
         for idx, obj in enumerate(CiscoRange(val, result_type=self.result_type)):
-            self._list.insert(ii + idx, obj)
+            self._items.insert(ii + idx, obj)
 
-        # Prune out any duplicate entries, and sort...
-        self._list = sorted(map(self.result_type, set(self._list)))
+        # Prune out any duplicate entries, and sort (lazily, see _list)...
+        self._dirty = True
         return self
 
     def append(self, val):
-        list_idx = len(self._list)
+        list_idx = len(self._items)
         self.insert(list_idx, val)
         return self
 
@@ -2840,29 +2789,38 @@ class CiscoRange(MutableSequence):
         return line_prefix, slot_prefix, range_text
 
     def _parse_dash_range(self, text):
-        """Parse a dash Cisco range into a discrete list of items"""
-        retval = set({})
+        """Parse a dash Cisco range into a sorted list of non-overlapping (begin, end) intervals; like range(), end is not included"""
+        intervals = list()
         for range_atom in text.split(","):
-            try:
-                begin, end = range_atom.split("-")
-            except ValueError:
+            if range_atom.count("-") == 1:
+                begin, _, end = range_atom.partition("-")
+            else:
                 ## begin and end are the same number
                 begin, end = range_atom, range_atom
             begin, end = int(begin.strip()), int(end.strip()) + 1
             assert begin > -1
             assert end > begin
-            retval.update(range(begin, end))
-        return sorted(list(retval))
+            intervals.append((begin, end))
+
+        # Merge overlapping and adjacent intervals...
+        intervals.sort()
+        retval = list()
+        for begin, end in intervals:
+            if retval and begin <= retval[-1][1]:
+                if end > retval[-1][1]:
+                    retval[-1] = (retval[-1][0], end)
+            else:
+                retval.append((begin, end))
+        return retval
 
     def _range(self):
         """Enumerate all values in the CiscoRange()"""
-
-        def combine(arg):
-            return self.line_prefix + self.slot_prefix + str(arg)
-
+        prefix_str = self.line_prefix + self.slot_prefix
+        result_type = self.result_type
+        intervals = self._parse_dash_range(self.range_text)
         return [
-            self.result_type(ii)
-            for ii in map(combine, self._parse_dash_range(self.range_text))
+            result_type(prefix_str + str(ii))
+            for ii in chain.from_iterable(range(begin, end) for begin, end in intervals)
         ]
 
     def remove(self, arg):
@@ -2897,48 +2855,28 @@ class CiscoRange(MutableSequence):
         prefix_str = self.line_prefix.strip() + self.slot_prefix.strip()
         prefix_str_len = len(prefix_str)
 
-        # Build a list of integers (without prefix_str)
-        input_str = list()
-        for ii in self._list:
-            # Removed try / except which is slower than sys.version_info
-            unicode_ii = str(ii)
-
-            # Removed this in version 1.5.27 because it's so slow...
-            # trailing_digits = re.sub(r"^{0}(\d+)$".format(prefix_str), "\g<1>", unicode_ii)
-
-            complete_len = len(unicode_ii)
-            # Assign ii to the trailing number after prefix_str...
-            #    this is much faster than regexp processing...
-            trailing_digits_len = complete_len - prefix_str_len
-            trailing_digits = unicode_ii[-1 * trailing_digits_len:]
-            input_str.append(int(trailing_digits))
+        # Build a sorted list of unique integers (without prefix_str)...
+        #    slicing off prefix_str is much faster than regexp processing,
+        #    and one pass replaces an append loop plus sorted(set(...))
+        input_str = sorted({int(str(ii)[prefix_str_len:]) for ii in self._list})
 
         if len(input_str) == 0:  # Special case, handle empty list
             return ""
 
-        # source - https://stackoverflow.com/a/51227915/667301
-        input_str = sorted(list(set(input_str)))
-        range_list = [input_str[0]]
-        for ii in range(len(input_str)):
-            if ii + 1 < len(input_str) and ii - 1 > -1:
-                if (input_str[ii] - input_str[ii - 1] == 1) and (
-                    input_str[ii + 1] - input_str[ii] == 1
-                ):
-                    if range_list[-1] != "-":
-                        range_list += ["-"]
-                    else:
-                        range_list = range_list
-                else:
-                    range_list += [input_str[ii]]
-        if len(input_str) > 1:
-            range_list += [input_str[len(input_str) - 1]]
-
-        # Build the return value from range_list...
-        retval = prefix_str + str(range_list[0])
-        for ii in range(1, len(range_list)):
-            if str(type(range_list[ii])) != str(type(range_list[ii - 1])):
-                retval += str(range_list[ii])
+        # Walk the sorted values once, emitting one token per run of
+        #    consecutive values...
+        input_len = len(input_str)
+        idx = 0
+        while idx < input_len:
+            end = idx
+            while end + 1 < input_len and input_str[end + 1] == input_str[end] + 1:
+                end += 1
+
+            if end - idx >= 2:
+                retval.append(f"{input_str[idx]}-{input_str[end]}")
             else:
-                retval += "," + str(range_list[ii])
+                # Runs of one or two values are listed individually
+                retval.extend(str(ii) for ii in input_str[idx:end + 1])
+            idx = end + 1
 
-        return retval
+        return prefix_str + ",".join(retval)
@@ -23,6 +23,7 @@ r""" test_Ccp_Util.py - Parse, Query, Build, and Modify IOS-style configs
 """
 
 
+import pickle
 import sys
 import os
 
@@ -34,6 +35,7 @@ from ciscoconfparse.ccp_util import IPv6Obj
 from ciscoconfparse.ccp_util import CiscoRange
 from ciscoconfparse.ccp_util import dns_lookup, reverse_dns_lookup
 from ciscoconfparse.ccp_util import collapse_addresses
+from ciscoconfparse.ccp_util import check_valid_ipaddress
 import pytest
 
 from ipaddress import IPv4Network, IPv6Network, IPv4Address, IPv6Address
@@ -137,6 +139,17 @@ def testL4Object_asa_gt01():
     assert pp.port_list ==[65535]
 
 
+def testL4Object_asa_neq01():
+    pp = L4Object(protocol="tcp", port_spec="neq smtp", syntax="asa")
+    assert pp.protocol == "tcp"
+    assert 25 not in pp.port_list
+    assert 24 in pp.port_list
+    assert 65535 in pp.port_list
+    assert pp.port_list == [ii for ii in range(1, 65536) if ii != 25]
+    assert pp.port_list[23:25] == [24, 26]
+    assert pp == L4Object(protocol="tcp", port_spec="neq 25", syntax="asa")
+
+
 @pytest.mark.xfail(
     sys.version_info[0] == 3 and sys.version_info[1] == 2,
     reason="Known failure in Python3.2 due to range()",
@@ -199,6 +212,19 @@ def testIPv4Obj_parse(addr_mask):
     assert isinstance(test_result, IPv4Obj)
 
 
+@pytest.mark.parametrize(
+    "addr_mask", [
+        "1.0.0.1/",
+        "1.0.0.1 24",
+        "1.0.0.1 /24",
+    ]
+)
+def testIPv4Obj_parse_invalid(addr_mask):
+    ## Truncated masks and a bare masklen after whitespace must not parse
+    with pytest.raises(ipaddress.AddressValueError):
+        IPv4Obj(addr_mask)
+
+
 def testIPv4Obj_set_masklen01():
 
     MASK_RESET = 32
@@ -536,6 +562,57 @@ def testIPv4Obj_contains_05():
     assert obj1 in obj2
 
 
+def testIPv4Obj_copy_01():
+    """Changing the prefixlen of an IPv4Obj() copy must not change the original"""
+    obj1 = IPv4Obj("1.1.1.1/24")
+    obj2 = IPv4Obj(obj1)
+    obj2.prefixlen = 16
+    assert obj1.prefixlen == 24
+    assert obj2.as_cidr_net == "1.1.0.0/16"
+
+
+def testIPv4Obj_get_01():
+    """IPv4Obj.get() should return a shared, cached instance for str inputs"""
+    obj = IPv4Obj.get("1.1.1.1/24")
+    assert obj == IPv4Obj("1.1.1.1/24")
+    assert obj is IPv4Obj.get("1.1.1.1/24")
+    # The shared instance is read-only; copies are not
+    with pytest.raises(AttributeError):
+        obj.prefixlen = 8
+    with pytest.raises(AttributeError):
+        obj.masklen = 8
+    assert IPv4Obj.get("1.1.1.1/24").as_cidr_addr == "1.1.1.1/24"
+    obj_copy = IPv4Obj(obj)
+    obj_copy.prefixlen = 8
+    assert obj_copy.prefixlen == 8
+    # Non-str inputs are not cached...
+    assert IPv4Obj.get(16843009) is not IPv4Obj.get(16843009)
+
+
+def testIPv4Obj_params_dict_01():
+    """params_dict is still available as a computed property"""
+    assert IPv4Obj("1.1.1.1 255.255.255.0").params_dict == {
+        'ipv4_addr': "1.1.1.1",
+        'ip_version': 4,
+        'ip_arg_str': "1.1.1.1/24",
+        'netmask': "255.255.255.0",
+        'masklen': 24,
+    }
+
+
+def testIPv4Obj_as_decimal_network_01():
+    """as_decimal_network treats each octet as a base-256 digit"""
+    obj = IPv4Obj("10.1.2.3/24")
+    assert obj.as_decimal_network == 10 * 256**3 + 1 * 256**2 + 2 * 256 + 0
+
+
+def testIPv4Obj_network_01():
+    """IPv4Obj().network should have the host bits masked off"""
+    obj = IPv4Obj("1.1.1.1/24")
+    assert obj.network == IPv4Network("1.1.1.0/24")
+    assert obj.network_address == IPv4Address("1.1.1.0")
+
+
 def testIPv6Obj_recursive():
     """IPv6Obj() should be able to parse itself"""
     obj = IPv6Obj(IPv6Obj("fe80:a:b:c:d:e::1/64"))
@@ -543,6 +620,83 @@ def testIPv6Obj_recursive():
     assert obj.prefixlen == 64
 
 
+def testIPv6Obj_copy_01():
+    """Changing the prefixlen of an IPv6Obj() copy must not change the original"""
+    obj1 = IPv6Obj("fe80::1/64")
+    obj2 = IPv6Obj(obj1)
+    obj2.prefixlen = 48
+    assert obj1.prefixlen == 64
+    assert obj2.as_cidr_net == "fe80::/48"
+
+
+def testIPv6Obj_is_ipv4_mapped_01():
+    """is_ipv4_mapped is True only for addresses in ::ffff:0:0/96"""
+    assert IPv6Obj("::ffff:192.0.2.1/128").is_ipv4_mapped is True
+    assert repr(IPv6Obj("::ffff:192.0.2.1/128")) == "<IPv6Obj ::ffff:192.0.2.1/128>"
+    assert IPv6Obj("::fffe:c000:201/128").is_ipv4_mapped is False
+    assert IPv6Obj("1::ffff:c000:201/128").is_ipv4_mapped is False
+
+
+def testIPv6Obj_hash_01():
+    """Equal IPv6Obj() instances must hash the same"""
+    assert hash(IPv6Obj("fe80::1/64")) == hash(IPv6Obj("FE80:0::1/64"))
+    assert len({IPv6Obj("fe80::1/64"), IPv6Obj("fe80::1/64"), IPv6Obj("fe80::1/48")}) == 2
+
+
+def testIPv6Obj_contains_01():
+    """__contains__() agrees on both sides of the /64 fast path"""
+    assert IPv6Obj("2001:db8:0:1::5/128") in IPv6Obj("2001:db8::/48")
+    assert IPv6Obj("2001:db8:1::5/128") not in IPv6Obj("2001:db8::/48")
+    assert IPv6Obj("2001:db8::1:0:0:5/128") in IPv6Obj("2001:db8::/64")
+    assert IPv6Obj("2001:db8::1:5/128") in IPv6Obj("2001:db8::1:0/112")
+    assert IPv6Obj("2001:db8::2:5/128") not in IPv6Obj("2001:db8::1:0/112")
+    assert IPv6Obj("2001:db8::/32") not in IPv6Obj("2001:db8::/48")
+
+
+def testIPv6Obj_is_flags_01():
+    """Memoized is_* flags must follow prefixlen changes"""
+    obj = IPv6Obj("fe80::1/64")
+    assert obj.is_link_local is True
+    assert obj.is_multicast is False
+    obj.prefixlen = 8
+    assert obj.is_link_local is False
+    assert IPv6Obj(obj).is_link_local is False
+
+
+def testIPv6Obj_pickle_01():
+    """IPv6Obj() still pickles after an is_* flag has been memoized"""
+    obj = IPv6Obj("fe80::1/64")
+    assert obj.is_private is True
+    obj_copy = pickle.loads(pickle.dumps(obj))
+    assert obj_copy == obj
+    assert obj_copy.is_private is True
+    assert obj_copy.is_link_local is True
+
+
+def testIPv6Obj_scoped_01():
+    """A %scope suffix is accepted and dropped on every Python version"""
+    obj = IPv6Obj("fe80::1%eth0/64")
+    assert obj.ip_object == IPv6Address("fe80::1")
+    assert obj.as_cidr_addr == "fe80::1/64"
+    assert obj == IPv6Obj("fe80::1/64")
+
+
+def testIPv6Obj_get_01():
+    """IPv6Obj.get() should return a shared, cached instance for str inputs"""
+    obj = IPv6Obj.get("fe80::1/64")
+    assert obj == IPv6Obj("fe80::1/64")
+    assert obj is IPv6Obj.get("fe80::1/64")
+    # The shared instance is read-only; copies are not
+    with pytest.raises(AttributeError):
+        obj.prefixlen = 8
+    with pytest.raises(AttributeError):
+        obj.masklen = 8
+    assert IPv6Obj.get("fe80::1/64").as_cidr_addr == "fe80::1/64"
+    obj_copy = IPv6Obj(obj)
+    obj_copy.prefixlen = 8
+    assert obj_copy.prefixlen == 8
+
+
 def testIPv6Obj_neq_01():
     """Simple in-equality test fail (ref - Github issue #180)"""
     assert IPv6Obj("::1") != ""
@@ -612,6 +766,27 @@ def test_reverse_dns_lookup():
         pytest.skip(test_result["error"])
 
 
+def test_reverse_dns_lookup_invalid_01():
+    """reverse_dns_lookup() rejects invalid octets before any query"""
+    with pytest.raises(AssertionError):
+        reverse_dns_lookup("999.999.999.999")
+    with pytest.raises(AssertionError):
+        reverse_dns_lookup("10.0.0.1/24")
+
+
+def test_check_valid_ipaddress_01():
+    """check_valid_ipaddress() returns the address family of valid addresses"""
+    assert check_valid_ipaddress("1.1.1.1") == ("1.1.1.1", 4)
+    assert check_valid_ipaddress(" 1.1.1.1/24 ") == ("1.1.1.1/24", 4)
+    assert check_valid_ipaddress("fe80::1") == ("fe80::1", 6)
+    assert check_valid_ipaddress("fe80::1/64") == ("fe80::1/64", 6)
+
+
+def test_check_valid_ipaddress_02():
+    """check_valid_ipaddress() rejects out-of-range octets"""
+    with pytest.raises(AssertionError):
+        check_valid_ipaddress("999.999.999.999")
+
 
 def test_CiscoRange_01():
     """Basic vlan range test"""
@@ -759,6 +934,12 @@ def test_CiscoRange_19():
     CiscoRange("interface Eth1/1,interface Eth1/12-20,interface Eth1/16,interface Eth1/10").as_list == result_correct
 
 
+def test_CiscoRange_20():
+    """Invalid range text must fail quickly (no catastrophic regex backtracking)"""
+    with pytest.raises(AssertionError):
+        CiscoRange("1" * 40 + "x")
+
+
 def test_CiscoRange_compressed_str_01():
     """compressed_str test"""
     assert CiscoRange("1,2, 3, 6, 7,  8 , 9, 911").compressed_str == "1-3,6-9,911"